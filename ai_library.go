@@ -3,6 +3,7 @@ package main
 import (
 	"context"
 	"fmt"
+	"sync"
 
 	"github.com/paularlott/mcp"
 	"github.com/paularlott/mcp/openai"
@@ -18,49 +19,49 @@ type RouterInterface interface {
 // AILibrary provides AI completion and tool calling capabilities
 type AILibrary struct {
 	router *Router
+
+	// complete and embedText call the upstream models, tests replace them to avoid needing a provider
+	complete  func(ctx context.Context, model string, messages []Message) (string, error)
+	embedText func(ctx context.Context, model string, text string) ([]float64, error)
 }
 
 // NewAILibrary creates a new AI library instance
 func NewAILibrary(router *Router) *AILibrary {
-	return &AILibrary{
+	ai := &AILibrary{
 		router: router,
 	}
+	ai.complete = ai.completion
+	ai.embedText = ai.embed
+	return ai
 }
 
 // GetLibrary returns the scriptling library object for AI operations
 func (ai *AILibrary) GetLibrary() *object.Library {
 	return object.NewLibraryBuilder("ai", "AI completion and tool calling capabilities").
 		FunctionWithHelp("completion", func(model string, messages []map[string]string) (string, error) {
-			// Convert messages to our format
-			var msgs []Message
-			for _, msg := range messages {
-				msgs = append(msgs, Message{
-					Role:    msg["role"],
-					Content: msg["content"],
-				})
+			return ai.complete(context.Background(), model, convertScriptMessages(messages))
+		}, "completion(model, messages) - Create a chat completion with automatic tool calling").
+		FunctionWithHelp("cached_completion", func(model string, messages []map[string]string) (string, error) {
+			return ai.cachedCompletion(context.Background(), model, convertScriptMessages(messages))
+		}, "cached_completion(model, messages) - Create a chat completion, reusing the result of an identical earlier request").
+		FunctionWithHelp("semantic_completion", func(model string, messages []map[string]string, embeddingModel string, threshold ...float64) (string, error) {
+			minScore := defaultSemanticCacheThreshold
+			if len(threshold) > 0 {
+				minScore = threshold[0]
 			}
 
-			req := &ChatCompletionRequest{
-				Model:    model,
-				Messages: msgs,
+			return ai.semanticCompletion(context.Background(), model, convertScriptMessages(messages), embeddingModel, minScore)
+		}, "semantic_completion(model, messages, embedding_model, threshold=0.92) - Create a chat completion, reusing the result of an earlier request with a similar final message").
+		FunctionWithHelp("batch_completion", func(model string, batch [][]map[string]string) ([]string, error) {
+			msgs := make([][]Message, len(batch))
+			for i, messages := range batch {
+				msgs[i] = convertScriptMessages(messages)
 			}
 
-			// Get completion with automatic tool calling
-			resp, err := ai.CreateChatCompletionWithTools(context.Background(), req)
-			if err != nil {
-				return "", err
-			}
-
-			// Return the response as a string
-			if len(resp.Choices) > 0 {
-				msg := &resp.Choices[0].Message
-				if content := msg.GetContentAsString(); content != "" {
-					return content, nil
-				}
-			}
-
-			return "", nil
-		}, "completion(model, messages) - Create a chat completion with automatic tool calling").
+			return batchCompletion(context.Background(), msgs, func(ctx context.Context, messages []Message) (string, error) {
+				return ai.complete(ctx, model, messages)
+			})
+		}, "batch_completion(model, batch) - Create a chat completion for each list of messages in batch, returning the responses in order").
 		FunctionWithHelp("embedding", func(model string, input interface{}) ([][]float64, error) {
 			req := &EmbeddingRequest{
 				Model: model,
@@ -179,6 +180,137 @@ func (ai *AILibrary) GetLibrary() *object.Library {
 		Build()
 }
 
+// completion runs a chat completion with automatic tool calling and returns the response text
+func (ai *AILibrary) completion(ctx context.Context, model string, messages []Message) (string, error) {
+	req := &ChatCompletionRequest{
+		Model:    model,
+		Messages: messages,
+	}
+
+	// Get completion with automatic tool calling
+	resp, err := ai.CreateChatCompletionWithTools(ctx, req)
+	if err != nil {
+		return "", err
+	}
+
+	// Return the response as a string
+	if len(resp.Choices) > 0 {
+		msg := &resp.Choices[0].Message
+		if content := msg.GetContentAsString(); content != "" {
+			return content, nil
+		}
+	}
+
+	return "", nil
+}
+
+// cachedCompletion runs a completion, reusing the response of an identical earlier or in-flight request
+func (ai *AILibrary) cachedCompletion(ctx context.Context, model string, messages []Message) (string, error) {
+	return ai.router.completionCache.GetOrLoad(completionCacheKey(model, messages), func() (string, error) {
+		return ai.complete(ctx, model, messages)
+	})
+}
+
+// semanticCompletion runs a completion, reusing the response of an earlier request to the same model with
+// the same preceding messages whose final message embeds within threshold of this one. If the embedding
+// fails it falls back to cachedCompletion.
+func (ai *AILibrary) semanticCompletion(ctx context.Context, model string, messages []Message, embeddingModel string, threshold float64) (string, error) {
+	if len(messages) == 0 {
+		return ai.complete(ctx, model, messages)
+	}
+
+	// Identical requests are answered without calling the embedding model
+	key := completionCacheKey(model, messages)
+	if response, ok := ai.router.completionCache.Get(key); ok {
+		return response, nil
+	}
+
+	// Only compare the final message against requests sharing the same model and earlier messages
+	partition := completionCacheKey(model, messages[:len(messages)-1])
+	embedding, err := ai.embedText(ctx, embeddingModel, messages[len(messages)-1].GetContentAsString())
+	if err != nil {
+		ai.router.logger.Warn("semantic cache embedding failed, using exact cache only", "embedding_model", embeddingModel, "error", err)
+		return ai.cachedCompletion(ctx, model, messages)
+	}
+
+	if response, ok := ai.router.semanticCache.Lookup(partition, embedding, threshold); ok {
+		return response, nil
+	}
+
+	response, err := ai.cachedCompletion(ctx, model, messages)
+	if err != nil {
+		return "", err
+	}
+
+	ai.router.semanticCache.Add(partition, embedding, response)
+	return response, nil
+}
+
+// batchCompletionConcurrency is the maximum number of batch_completion requests in flight at once
+const batchCompletionConcurrency = 16
+
+// batchCompletion calls complete for each list of messages concurrently and returns the responses in order.
+// The first error cancels the context passed to complete and no further items are started.
+func batchCompletion(ctx context.Context, batch [][]Message, complete func(context.Context, []Message) (string, error)) ([]string, error) {
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	responses := make([]string, len(batch))
+	sem := make(chan struct{}, batchCompletionConcurrency)
+	var wg sync.WaitGroup
+	var errOnce sync.Once
+	var firstErr error
+
+	for i, messages := range batch {
+		wg.Add(1)
+		go func(i int, messages []Message) {
+			defer wg.Done()
+
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			// Don't start new requests once one has failed
+			if ctx.Err() != nil {
+				return
+			}
+
+			response, err := complete(ctx, messages)
+			if err != nil {
+				errOnce.Do(func() {
+					firstErr = fmt.Errorf("batch item %d: %w", i, err)
+					cancel()
+				})
+				return
+			}
+			responses[i] = response
+		}(i, messages)
+	}
+
+	wg.Wait()
+	if firstErr != nil {
+		return nil, firstErr
+	}
+
+	return responses, nil
+}
+
+// embed returns the embedding vector for a single text
+func (ai *AILibrary) embed(ctx context.Context, model string, text string) ([]float64, error) {
+	resp, err := ai.router.CreateEmbedding(ctx, &EmbeddingRequest{
+		Model: model,
+		Input: text,
+	})
+	if err != nil {
+		return nil, err
+	}
+
+	if len(resp.Data) == 0 {
+		return nil, fmt.Errorf("no embedding returned for model %s", model)
+	}
+
+	return resp.Data[0].Embedding, nil
+}
+
 // CreateChatCompletionWithTools creates a chat completion with automatic tool calling
 func (ai *AILibrary) CreateChatCompletionWithTools(ctx context.Context, req *ChatCompletionRequest) (*ChatCompletionResponse, error) {
 	// Convert our types to openai types
@@ -231,6 +363,17 @@ func (ai *AILibrary) CreateChatCompletionWithTools(ctx context.Context, req *Cha
 }
 
 // Helper functions to convert between types
+func convertScriptMessages(messages []map[string]string) []Message {
+	var msgs []Message
+	for _, msg := range messages {
+		msgs = append(msgs, Message{
+			Role:    msg["role"],
+			Content: msg["content"],
+		})
+	}
+	return msgs
+}
+
 func convertMessagesToOpenAI(messages []Message) []openai.Message {
 	result := make([]openai.Message, len(messages))
 	for i, msg := range messages {
@@ -0,0 +1,242 @@
+package main
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"strings"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+// userMessages builds a batch with one single-message conversation per content string
+func userMessages(contents ...string) [][]Message {
+	batch := make([][]Message, len(contents))
+	for i, content := range contents {
+		batch[i] = []Message{{Role: "user", Content: content}}
+	}
+	return batch
+}
+
+// TestBatchCompletionOrder tests that responses are returned in input order
+func TestBatchCompletionOrder(t *testing.T) {
+	const items = 50
+	contents := make([]string, items)
+	for i := range contents {
+		contents[i] = fmt.Sprintf("q%d", i)
+	}
+
+	responses, err := batchCompletion(context.Background(), userMessages(contents...), func(ctx context.Context, messages []Message) (string, error) {
+		content := messages[0].GetContentAsString()
+
+		// Finish later items first so completion order differs from input order
+		var n int
+		fmt.Sscanf(content, "q%d", &n)
+		time.Sleep(time.Duration(items-n) * 100 * time.Microsecond)
+
+		return "answer " + content, nil
+	})
+	if err != nil {
+		t.Fatalf("batchCompletion failed: %v", err)
+	}
+
+	if len(responses) != items {
+		t.Fatalf("Expected %d responses, got %d", items, len(responses))
+	}
+	for i, response := range responses {
+		expected := fmt.Sprintf("answer q%d", i)
+		if response != expected {
+			t.Errorf("Response %d expected '%s', got '%s'", i, expected, response)
+		}
+	}
+}
+
+// TestBatchCompletionConcurrencyCap tests that no more than batchCompletionConcurrency items run at once
+func TestBatchCompletionConcurrencyCap(t *testing.T) {
+	const items = batchCompletionConcurrency * 3
+
+	var inFlight, maxInFlight int32
+	release := make(chan struct{})
+	done := make(chan struct{})
+
+	go func() {
+		defer close(done)
+		_, err := batchCompletion(context.Background(), userMessages(make([]string, items)...), func(ctx context.Context, messages []Message) (string, error) {
+			n := atomic.AddInt32(&inFlight, 1)
+			for {
+				peak := atomic.LoadInt32(&maxInFlight)
+				if n <= peak || atomic.CompareAndSwapInt32(&maxInFlight, peak, n) {
+					break
+				}
+			}
+
+			<-release
+			atomic.AddInt32(&inFlight, -1)
+			return "ok", nil
+		})
+		if err != nil {
+			t.Errorf("batchCompletion failed: %v", err)
+		}
+	}()
+
+	// Wait for the first wave to fill every slot
+	deadline := time.Now().Add(time.Second)
+	for atomic.LoadInt32(&inFlight) < batchCompletionConcurrency && time.Now().Before(deadline) {
+		time.Sleep(time.Millisecond)
+	}
+
+	// Give any extra goroutines the chance to exceed the cap
+	time.Sleep(20 * time.Millisecond)
+	if n := atomic.LoadInt32(&inFlight); n != batchCompletionConcurrency {
+		t.Errorf("Expected %d requests in flight, got %d", batchCompletionConcurrency, n)
+	}
+
+	close(release)
+	<-done
+
+	if peak := atomic.LoadInt32(&maxInFlight); peak > batchCompletionConcurrency {
+		t.Errorf("Expected at most %d concurrent requests, got %d", batchCompletionConcurrency, peak)
+	}
+}
+
+// TestBatchCompletionCancelOnError tests that the first error cancels the remaining items
+func TestBatchCompletionCancelOnError(t *testing.T) {
+	const items = batchCompletionConcurrency * 3
+
+	var started, cancelled int32
+	responses, err := batchCompletion(context.Background(), userMessages(make([]string, items)...), func(ctx context.Context, messages []Message) (string, error) {
+		// The first item to start fails, the rest block until the failure cancels the batch
+		if atomic.AddInt32(&started, 1) == 1 {
+			time.Sleep(10 * time.Millisecond)
+			return "", errors.New("upstream failed")
+		}
+
+		select {
+		case <-ctx.Done():
+			atomic.AddInt32(&cancelled, 1)
+			return "", ctx.Err()
+		case <-time.After(5 * time.Second):
+			return "ok", nil
+		}
+	})
+
+	if err == nil {
+		t.Fatal("Expected an error from the failing item")
+	}
+	if !strings.HasPrefix(err.Error(), "batch item ") || !strings.Contains(err.Error(), "upstream failed") {
+		t.Errorf("Expected error to identify the failing item and its cause, got '%v'", err)
+	}
+	if responses != nil {
+		t.Errorf("Expected no responses on error, got %v", responses)
+	}
+
+	// Items still waiting for a slot when the batch was cancelled must not start
+	if n := atomic.LoadInt32(&started); n >= items {
+		t.Errorf("Expected fewer than %d items to start, got %d", items, n)
+	}
+	if n := atomic.LoadInt32(&cancelled); n != atomic.LoadInt32(&started)-1 {
+		t.Errorf("Expected every other started item to be cancelled, got %d of %d", n, atomic.LoadInt32(&started)-1)
+	}
+}
+
+// newTestAILibrary creates an AI library with fresh caches whose completions echo the final message
+// and whose embeddings come from vectors, counting the calls made to each
+func newTestAILibrary(vectors map[string][]float64, completions, embeddings *int32) *AILibrary {
+	ai := NewAILibrary(&Router{
+		logger:          &testLogger{},
+		completionCache: newCompletionCache(defaultCompletionCacheSize, defaultCompletionCacheTTL),
+		semanticCache:   newSemanticCache(defaultSemanticCacheSize, defaultSemanticCacheTTL),
+	})
+	ai.complete = func(ctx context.Context, model string, messages []Message) (string, error) {
+		atomic.AddInt32(completions, 1)
+		return "answer " + messages[len(messages)-1].GetContentAsString(), nil
+	}
+	ai.embedText = func(ctx context.Context, model string, text string) ([]float64, error) {
+		atomic.AddInt32(embeddings, 1)
+		vector, ok := vectors[text]
+		if !ok {
+			return nil, errors.New("embedding model unavailable")
+		}
+		return vector, nil
+	}
+	return ai
+}
+
+// conversation builds a system and user message pair
+func conversation(system, question string) []Message {
+	return []Message{
+		{Role: "system", Content: system},
+		{Role: "user", Content: question},
+	}
+}
+
+// TestSemanticCompletion tests exact repeats, similar questions and partitioning by earlier messages
+func TestSemanticCompletion(t *testing.T) {
+	var completions, embeddings int32
+	ai := newTestAILibrary(map[string][]float64{
+		"What is the capital of France?":     {1, 0, 0},
+		"What's the capital city of France?": {0.99, 0.1, 0},
+		"How tall is Mount Everest?":         {0, 1, 0},
+	}, &completions, &embeddings)
+	ctx := context.Background()
+
+	response, err := ai.semanticCompletion(ctx, "model", conversation("Be brief.", "What is the capital of France?"), "embed", defaultSemanticCacheThreshold)
+	if err != nil {
+		t.Fatalf("semanticCompletion failed: %v", err)
+	}
+	if response != "answer What is the capital of France?" {
+		t.Errorf("Expected 'answer What is the capital of France?', got '%s'", response)
+	}
+
+	// An identical request is served from the exact cache without embedding
+	ai.semanticCompletion(ctx, "model", conversation("Be brief.", "What is the capital of France?"), "embed", defaultSemanticCacheThreshold)
+	if completions != 1 || embeddings != 1 {
+		t.Errorf("Expected 1 completion and 1 embedding after an exact repeat, got %d and %d", completions, embeddings)
+	}
+
+	// A paraphrase is served from the semantic cache
+	response, _ = ai.semanticCompletion(ctx, "model", conversation("Be brief.", "What's the capital city of France?"), "embed", defaultSemanticCacheThreshold)
+	if response != "answer What is the capital of France?" {
+		t.Errorf("Expected the cached answer for a paraphrase, got '%s'", response)
+	}
+	if completions != 1 {
+		t.Errorf("Expected a paraphrase not to call the model, got %d completions", completions)
+	}
+
+	// A dissimilar question calls the model
+	ai.semanticCompletion(ctx, "model", conversation("Be brief.", "How tall is Mount Everest?"), "embed", defaultSemanticCacheThreshold)
+	if completions != 2 {
+		t.Errorf("Expected a dissimilar question to call the model, got %d completions", completions)
+	}
+
+	// The same question under a different system message is in another partition
+	ai.semanticCompletion(ctx, "model", conversation("Be detailed.", "What's the capital city of France?"), "embed", defaultSemanticCacheThreshold)
+	if completions != 3 {
+		t.Errorf("Expected a different system message to call the model, got %d completions", completions)
+	}
+}
+
+// TestSemanticCompletionEmbeddingFailure tests that a failed embedding falls back to the exact cache
+func TestSemanticCompletionEmbeddingFailure(t *testing.T) {
+	var completions, embeddings int32
+	ai := newTestAILibrary(map[string][]float64{}, &completions, &embeddings)
+	ctx := context.Background()
+
+	response, err := ai.semanticCompletion(ctx, "model", conversation("Be brief.", "What is the capital of France?"), "embed", defaultSemanticCacheThreshold)
+	if err != nil {
+		t.Fatalf("Expected embedding failure to fall back to a completion, got error: %v", err)
+	}
+	if response != "answer What is the capital of France?" {
+		t.Errorf("Expected 'answer What is the capital of France?', got '%s'", response)
+	}
+	if ai.router.semanticCache.Len() != 0 {
+		t.Errorf("Expected nothing added to the semantic cache, got %d entries", ai.router.semanticCache.Len())
+	}
+
+	// The fallback result is still cached for identical requests
+	ai.semanticCompletion(ctx, "model", conversation("Be brief.", "What is the capital of France?"), "embed", defaultSemanticCacheThreshold)
+	if completions != 1 || embeddings != 1 {
+		t.Errorf("Expected 1 completion and 1 embedding after a repeat, got %d and %d", completions, embeddings)
+	}
+}
@@ -0,0 +1,164 @@
+package main
+
+import (
+	"container/list"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"fmt"
+	"sync"
+	"time"
+)
+
+const (
+	defaultCompletionCacheSize = 1024
+	defaultCompletionCacheTTL  = 10 * time.Minute
+)
+
+// completionCache is an in-memory LRU cache of completion results with per-entry expiry
+type completionCache struct {
+	mu       sync.Mutex
+	maxItems int
+	ttl      time.Duration
+	items    map[string]*list.Element
+	lru      *list.List // front is most recently used
+	inflight map[string]*completionCacheCall
+}
+
+// completionCacheCall is a load in progress that concurrent callers for the same key wait on
+type completionCacheCall struct {
+	done  chan struct{}
+	value string
+	err   error
+}
+
+// completionCacheEntry is a single cached completion
+type completionCacheEntry struct {
+	key     string
+	value   string
+	expires time.Time
+}
+
+// newCompletionCache creates a cache holding at most maxItems entries for ttl each
+func newCompletionCache(maxItems int, ttl time.Duration) *completionCache {
+	return &completionCache{
+		maxItems: maxItems,
+		ttl:      ttl,
+		items:    make(map[string]*list.Element),
+		lru:      list.New(),
+		inflight: make(map[string]*completionCacheCall),
+	}
+}
+
+// completionCacheKey returns a content hash of the model and messages
+func completionCacheKey(model string, messages []Message) string {
+	data, _ := json.Marshal(struct {
+		Model    string    `json:"m"`
+		Messages []Message `json:"msgs"`
+	}{
+		Model:    model,
+		Messages: messages,
+	})
+	sum := sha256.Sum256(data)
+	return hex.EncodeToString(sum[:])
+}
+
+// Get returns the cached value for key if present and not expired
+func (c *completionCache) Get(key string) (string, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.get(key)
+}
+
+// GetOrLoad returns the cached value for key, calling load to produce it on a miss.
+// Concurrent misses for the same key share a single call to load, and only
+// successful results are cached.
+func (c *completionCache) GetOrLoad(key string, load func() (string, error)) (string, error) {
+	c.mu.Lock()
+	if value, ok := c.get(key); ok {
+		c.mu.Unlock()
+		return value, nil
+	}
+
+	if call, ok := c.inflight[key]; ok {
+		c.mu.Unlock()
+		<-call.done
+		return call.value, call.err
+	}
+
+	call := &completionCacheCall{done: make(chan struct{})}
+	c.inflight[key] = call
+	c.mu.Unlock()
+
+	c.runLoad(key, call, load)
+	return call.value, call.err
+}
+
+// runLoad runs load for an in-flight call and releases its waiters. A panic in load
+// is returned to every caller as an error so the key is never left in flight.
+func (c *completionCache) runLoad(key string, call *completionCacheCall, load func() (string, error)) {
+	defer func() {
+		if r := recover(); r != nil {
+			call.value, call.err = "", fmt.Errorf("completion cache load panicked: %v", r)
+		}
+
+		c.mu.Lock()
+		delete(c.inflight, key)
+		if call.err == nil {
+			c.set(key, call.value)
+		}
+		c.mu.Unlock()
+		close(call.done)
+	}()
+
+	call.value, call.err = load()
+}
+
+// get returns the value for key, the caller must hold the lock
+func (c *completionCache) get(key string) (string, bool) {
+	elem, exists := c.items[key]
+	if !exists {
+		return "", false
+	}
+
+	entry := elem.Value.(*completionCacheEntry)
+	if time.Now().After(entry.expires) {
+		c.lru.Remove(elem)
+		delete(c.items, key)
+		return "", false
+	}
+
+	c.lru.MoveToFront(elem)
+	return entry.value, true
+}
+
+// set stores value under key, the caller must hold the lock
+func (c *completionCache) set(key, value string) {
+	expires := time.Now().Add(c.ttl)
+	if elem, exists := c.items[key]; exists {
+		entry := elem.Value.(*completionCacheEntry)
+		entry.value = value
+		entry.expires = expires
+		c.lru.MoveToFront(elem)
+		return
+	}
+
+	c.items[key] = c.lru.PushFront(&completionCacheEntry{
+		key:     key,
+		value:   value,
+		expires: expires,
+	})
+
+	for c.maxItems > 0 && c.lru.Len() > c.maxItems {
+		oldest := c.lru.Back()
+		c.lru.Remove(oldest)
+		delete(c.items, oldest.Value.(*completionCacheEntry).key)
+	}
+}
+
+// Len returns the number of entries in the cache, including expired ones not yet evicted
+func (c *completionCache) Len() int {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.lru.Len()
+}
@@ -0,0 +1,204 @@
+package main
+
+import (
+	"errors"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+// TestCompletionCacheKey tests that keys depend on the model and messages
+func TestCompletionCacheKey(t *testing.T) {
+	messages := []Message{
+		{Role: "system", Content: "You are helpful."},
+		{Role: "user", Content: "Hello"},
+	}
+
+	key := completionCacheKey("model-a", messages)
+	if key != completionCacheKey("model-a", messages) {
+		t.Error("Expected identical requests to produce the same key")
+	}
+
+	if key == completionCacheKey("model-b", messages) {
+		t.Error("Expected a different model to produce a different key")
+	}
+
+	changed := []Message{
+		{Role: "system", Content: "You are helpful."},
+		{Role: "user", Content: "Goodbye"},
+	}
+	if key == completionCacheKey("model-a", changed) {
+		t.Error("Expected different messages to produce a different key")
+	}
+}
+
+// seedCompletionCache stores value under key by loading it through GetOrLoad
+func seedCompletionCache(cache *completionCache, key, value string) {
+	cache.GetOrLoad(key, func() (string, error) {
+		return value, nil
+	})
+}
+
+// TestCompletionCacheGet tests basic hits and misses
+func TestCompletionCacheGet(t *testing.T) {
+	cache := newCompletionCache(10, time.Minute)
+
+	if _, ok := cache.Get("missing"); ok {
+		t.Error("Expected miss for unknown key")
+	}
+
+	seedCompletionCache(cache, "key", "value")
+	value, ok := cache.Get("key")
+	if !ok {
+		t.Fatal("Expected hit after a load")
+	}
+	if value != "value" {
+		t.Errorf("Expected 'value', got '%s'", value)
+	}
+	if cache.Len() != 1 {
+		t.Errorf("Expected 1 entry, got %d", cache.Len())
+	}
+}
+
+// TestCompletionCacheExpiry tests that entries expire after the TTL
+func TestCompletionCacheExpiry(t *testing.T) {
+	cache := newCompletionCache(10, 10*time.Millisecond)
+
+	seedCompletionCache(cache, "key", "value")
+	time.Sleep(20 * time.Millisecond)
+
+	if _, ok := cache.Get("key"); ok {
+		t.Error("Expected expired entry to be a miss")
+	}
+	if cache.Len() != 0 {
+		t.Errorf("Expected expired entry to be removed, got %d entries", cache.Len())
+	}
+}
+
+// TestCompletionCacheEviction tests that the least recently used entry is evicted
+func TestCompletionCacheEviction(t *testing.T) {
+	cache := newCompletionCache(2, time.Minute)
+
+	seedCompletionCache(cache, "a", "1")
+	seedCompletionCache(cache, "b", "2")
+
+	// Touch a so that b becomes the least recently used
+	cache.Get("a")
+	seedCompletionCache(cache, "c", "3")
+
+	if _, ok := cache.Get("b"); ok {
+		t.Error("Expected 'b' to be evicted")
+	}
+	if _, ok := cache.Get("a"); !ok {
+		t.Error("Expected 'a' to be kept")
+	}
+	if _, ok := cache.Get("c"); !ok {
+		t.Error("Expected 'c' to be kept")
+	}
+}
+
+// TestCompletionCacheGetOrLoad tests that loaded values are cached and errors are not
+func TestCompletionCacheGetOrLoad(t *testing.T) {
+	cache := newCompletionCache(10, time.Minute)
+
+	_, err := cache.GetOrLoad("key", func() (string, error) {
+		return "", errors.New("upstream failed")
+	})
+	if err == nil {
+		t.Fatal("Expected load error to be returned")
+	}
+	if _, ok := cache.Get("key"); ok {
+		t.Error("Expected failed load not to be cached")
+	}
+
+	value, err := cache.GetOrLoad("key", func() (string, error) {
+		return "loaded", nil
+	})
+	if err != nil {
+		t.Fatalf("GetOrLoad failed: %v", err)
+	}
+	if value != "loaded" {
+		t.Errorf("Expected 'loaded', got '%s'", value)
+	}
+
+	value, _ = cache.GetOrLoad("key", func() (string, error) {
+		t.Error("Expected cached value to be used without loading")
+		return "", nil
+	})
+	if value != "loaded" {
+		t.Errorf("Expected 'loaded', got '%s'", value)
+	}
+}
+
+// TestCompletionCacheGetOrLoadCoalesces tests that concurrent misses share one load
+func TestCompletionCacheGetOrLoadCoalesces(t *testing.T) {
+	cache := newCompletionCache(10, time.Minute)
+
+	var loads int32
+	release := make(chan struct{})
+	load := func() (string, error) {
+		atomic.AddInt32(&loads, 1)
+		<-release
+		return "shared", nil
+	}
+
+	const callers = 8
+	results := make([]string, callers)
+	var wg sync.WaitGroup
+	for i := 0; i < callers; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			results[i], _ = cache.GetOrLoad("key", load)
+		}(i)
+	}
+
+	// Give the callers time to queue behind the first load
+	time.Sleep(20 * time.Millisecond)
+	close(release)
+	wg.Wait()
+
+	if n := atomic.LoadInt32(&loads); n != 1 {
+		t.Errorf("Expected 1 load, got %d", n)
+	}
+	for i, result := range results {
+		if result != "shared" {
+			t.Errorf("Caller %d expected 'shared', got '%s'", i, result)
+		}
+	}
+}
+
+// TestCompletionCacheGetOrLoadPanic tests that a panicking load is returned as an error and does not leave the key in flight
+func TestCompletionCacheGetOrLoadPanic(t *testing.T) {
+	cache := newCompletionCache(10, time.Minute)
+
+	_, err := cache.GetOrLoad("key", func() (string, error) {
+		panic("provider exploded")
+	})
+	if err == nil || !strings.Contains(err.Error(), "provider exploded") {
+		t.Errorf("Expected the panic to be returned as an error, got '%v'", err)
+	}
+
+	done := make(chan struct{})
+	var value string
+	go func() {
+		defer close(done)
+		value, err = cache.GetOrLoad("key", func() (string, error) {
+			return "loaded", nil
+		})
+	}()
+
+	select {
+	case <-done:
+	case <-time.After(time.Second):
+		t.Fatal("Expected GetOrLoad after a panic to return, but it blocked")
+	}
+	if err != nil {
+		t.Fatalf("GetOrLoad failed: %v", err)
+	}
+	if value != "loaded" {
+		t.Errorf("Expected 'loaded', got '%s'", value)
+	}
+}
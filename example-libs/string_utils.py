@@ -12,7 +12,9 @@ def to_lowercase(s):
 
 def capitalize_words(s):
     """Capitalize the first letter of each word"""
-    return ' '.join(word.capitalize() for word in s.split())
+    # str.title() and a \b\w regex both capitalize after apostrophes ("don't" -> "Don'T"),
+    # and title() also after digits ("3rd" -> "3Rd"), so capitalize each word instead
+    return ' '.join([word.capitalize() for word in s.split()])
 
 def count_words(s):
     """Count the number of words in a string"""
@@ -24,5 +26,49 @@ def remove_spaces(s):
 
 def is_palindrome(s):
     """Check if a string is a palindrome (ignoring case and spaces)"""
-    cleaned = s.lower().replace(' ', '')
-    return cleaned == cleaned[::-1]
\ No newline at end of file
+    # Walk inwards from both ends, stopping at the first mismatch. Characters are
+    # lowercased one at a time, so one that lowercases to several code points
+    # ("İ" to "i" plus a combining dot) still counts as one: "İ" is a palindrome
+    # here, whereas lowercasing the whole string first would say it is not
+    i = 0
+    j = len(s) - 1
+    while i < j:
+        if s[i] == ' ':
+            i += 1
+            continue
+        if s[j] == ' ':
+            j -= 1
+            continue
+        if s[i].lower() != s[j].lower():
+            return False
+        i += 1
+        j -= 1
+    return True
+
+def reverse_string_batch(strings):
+    """Return the reverse of each string in a list"""
+    return [s[::-1] for s in strings]
+
+def to_uppercase_batch(strings):
+    """Convert each string in a list to uppercase"""
+    return [s.upper() for s in strings]
+
+def to_lowercase_batch(strings):
+    """Convert each string in a list to lowercase"""
+    return [s.lower() for s in strings]
+
+def capitalize_words_batch(strings):
+    """Capitalize the first letter of each word in each string in a list"""
+    return [capitalize_words(s) for s in strings]
+
+def count_words_batch(strings):
+    """Count the number of words in each string in a list"""
+    return [count_words(s) for s in strings]
+
+def remove_spaces_batch(strings):
+    """Remove all spaces from each string in a list"""
+    return [s.replace(' ', '') for s in strings]
+
+def is_palindrome_batch(strings):
+    """Check if each string in a list is a palindrome (ignoring case and spaces)"""
+    return [is_palindrome(s) for s in strings]
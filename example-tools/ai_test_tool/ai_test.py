@@ -1,20 +1,62 @@
+import json
 import llmr.ai
 import llmr.mcp
 
-# Get the question from parameters
+# Fixed system prompt guiding appropriate tool usage. Keep it byte-for-byte
+# stable so providers with prefix caching can reuse it across requests.
+SYSTEM_PROMPT = """You are a helpful assistant with access to tools.
+Use tool_search to find tools, and execute_tool to run them."""
+
+def _parse_questions(value):
+    """Return the non-empty list of strings encoded in value as JSON, or None if it is not one"""
+    try:
+        questions = json.loads(value)
+    except Exception:
+        return None
+    if not isinstance(questions, list) or not questions:
+        return None
+    for q in questions:
+        if not isinstance(q, str):
+            return None
+    return questions
+
+# Get the question, or a JSON list of questions, from parameters
 question = llmr.mcp.get("question")
+questions = llmr.mcp.get("questions", "")
 model = llmr.mcp.get("model", "mistralai/devstral-small-2-2512")
+embedding_model = llmr.mcp.get("embedding_model", "")
+
+system_message = {"role": "system", "content": SYSTEM_PROMPT}
+
+if questions:
+    questions = _parse_questions(questions)
+    if questions is None:
+        llmr.mcp.return_string("Error: 'questions' must be a non-empty JSON list of strings")
+    else:
+        print(f"Questions: {len(questions)}")
+        print(f"Model: {model}")
+
+        # Answer every question with a single batch request
+        batch = [[system_message, {"role": "user", "content": q}] for q in questions]
+        responses = llmr.ai.batch_completion(model, batch)
 
-print("Question: " + str(question))
-print("Model: " + str(model))
+        llmr.mcp.return_string("\n".join(responses))
+elif not question:
+    llmr.mcp.return_string("Error: Please provide a 'question' or 'questions' parameter")
+else:
+    print(f"Question: {question}")
+    print(f"Model: {model}")
 
-# Build messages with a system prompt guiding appropriate tool usage
-messages = [
-    {"role": "system", "content": """You are a helpful assistant with access to tools.
-Use tool_search to find tools, and execute_tool to run them."""},
-    {"role": "user", "content": question}
-]
+    messages = [
+        system_message,
+        {"role": "user", "content": question}
+    ]
 
-response = llmr.ai.completion(model, messages)
+    # Repeated questions reuse the earlier answer instead of re-running inference,
+    # with an embedding model paraphrased questions are matched as well
+    if embedding_model:
+        response = llmr.ai.semantic_completion(model, messages, embedding_model)
+    else:
+        response = llmr.ai.cached_completion(model, messages)
 
-llmr.mcp.return_string("AI Response: " + str(response))
\ No newline at end of file
+    llmr.mcp.return_string(f"AI Response: {response}")
\ No newline at end of file
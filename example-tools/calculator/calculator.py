@@ -1,23 +1,26 @@
 # Import MCP library for proper result handling
 import llmr.mcp
 
+# Map each operation to the function that performs it
+OPERATIONS = {
+    "add": lambda a, b: a + b,
+    "subtract": lambda a, b: a - b,
+    "multiply": lambda a, b: a * b,
+    "divide": lambda a, b: a / b,
+}
+
 def calculate(operation, a, b):
     """Perform the calculation with proper error handling"""
     a = float(a)
     b = float(b)
 
-    if operation == "add":
-        return a + b
-    elif operation == "subtract":
-        return a - b
-    elif operation == "multiply":
-        return a * b
-    elif operation == "divide":
-        if b == 0:
-            return "Error: Division by zero"
-        return a / b
-    else:
+    op = OPERATIONS.get(operation)
+    if op is None:
         return "Error: Unknown operation"
+    if operation == "divide" and b == 0:
+        return "Error: Division by zero"
+
+    return op(a, b)
 
 # Use llmr.mcp.get() to access required parameters
 operation = llmr.mcp.get("operation")
@@ -26,4 +29,4 @@ b = llmr.mcp.get("b")
 result = calculate(operation, a, b)
 
 # Return the result using MCP library
-llmr.mcp.return_string(str(result))
\ No newline at end of file
+llmr.mcp.return_string(f"{result}")
\ No newline at end of file
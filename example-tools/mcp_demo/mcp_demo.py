@@ -2,154 +2,200 @@
 MCP Demo Tool - Demonstrates MCP library functions
 
 This tool shows how to use:
-- llmr.llmr.mcp.list_tools() - List all available MCP tools
-- llmr.llmr.mcp.tool_search(query) - Search for tools by keyword
-- llmr.llmr.mcp.execute_tool(name, args) - Execute a discovered tool
-- llmr.llmr.mcp.execute_script(code) - Execute arbitrary code
-- llmr.llmr.mcp.call_tool(name, args) - Call any MCP tool directly
+- llmr.mcp.list_tools() - List all available MCP tools
+- llmr.mcp.tool_search(query) - Search for tools by keyword
+- llmr.mcp.execute_tool(name, args) - Execute a discovered tool
+- llmr.mcp.execute_code(code) - Execute arbitrary code
+- llmr.mcp.call_tool(name, args) - Call any MCP tool directly
 """
 
 import llmr.mcp
 import json
+import threads
 
 # Get parameters
-action = llmr.llmr.mcp.get("action", "list")
-query = llmr.llmr.mcp.get("query", "")
-args_str = llmr.llmr.mcp.get("args", "{}")
+_get = llmr.mcp.get
+action = _get("action", "list")
+query = _get("query", "")
+args_str = _get("args", "{}")
+
+# Parse args if provided, the default "{}" needs no parsing
+args = {}
+if args_str and args_str != "{}":
+    try:
+        args = json.loads(args_str)
+    except Exception:
+        args = {}
 
-# Parse args if provided
-try:
-    args = json.loads(args_str) if args_str else {}
-except:
-    args = {}
+def _safe_call(output_prefix, error_prefix, fn, *fn_args):
+    """Call fn and return its output, or the error if it raises, after the matching prefix"""
+    try:
+        return f"{output_prefix}{fn(*fn_args)}"
+    except Exception as e:
+        return f"{error_prefix}{e}"
 
-result = []
+def _attempt(fn, *fn_args):
+    """Call fn and return its result and None, or None and the error if it raises"""
+    try:
+        return fn(*fn_args), None
+    except Exception as e:
+        return None, e
 
-if action == "list":
-    # Demonstrate llmr.mcp.list_tools()
-    result.append("=== MCP List Tools Demo ===\n")
-    result.append("Using llmr.mcp.list_tools() to get all available tools:\n\n")
+def _do_list(query, args, append):
+    """Demonstrate llmr.mcp.list_tools()"""
+    append("=== MCP List Tools Demo ===\n")
+    append("Using llmr.mcp.list_tools() to get all available tools:\n\n")
 
     tools = llmr.mcp.list_tools()
     for tool in tools:
-        result.append("• " + tool['name'] + ": " + tool['description'] + "\n")
+        append(f"• {tool['name']}: {tool['description']}\n")
 
-    result.append("\nTotal: " + str(len(tools)) + " tools available")
+    append(f"\nTotal: {len(tools)} tools available")
 
-elif action == "search":
-    # Demonstrate llmr.mcp.tool_search()
-    result.append("=== MCP Tool Search Demo ===\n")
-    result.append("Using llmr.mcp.tool_search(\"" + query + "\") to find matching tools:\n\n")
+def _do_search(query, args, append):
+    """Demonstrate llmr.mcp.tool_search()"""
+    append("=== MCP Tool Search Demo ===\n")
+    append(f"Using llmr.mcp.tool_search(\"{query}\") to find matching tools:\n\n")
 
     if not query:
-        result.append("Error: Please provide a 'query' parameter for search")
+        append("Error: Please provide a 'query' parameter for search")
+        return
+
+    matches = llmr.mcp.tool_search(query)
+    if matches:
+        for tool in matches:
+            score = tool.get('score', 0)
+            append(f"• {tool['name']} (score: {score})\n  {tool['description']}\n\n")
+        append(f"Found {len(matches)} matching tools")
     else:
-        matches = llmr.mcp.tool_search(query)
-        if matches:
-            for tool in matches:
-                score = tool.get('score', 0)
-                result.append("• " + tool['name'] + " (score: " + str(score) + ")\n")
-                result.append("  " + tool['description'] + "\n\n")
-            result.append("Found " + str(len(matches)) + " matching tools")
-        else:
-            result.append("No tools found matching your query")
-
-elif action == "execute":
-    # Demonstrate llmr.mcp.execute_tool()
-    result.append("=== MCP Execute Tool Demo ===\n")
-    result.append("Using llmr.mcp.execute_tool(\"" + query + "\", " + str(args) + ") to run a tool:\n\n")
+        append("No tools found matching your query")
+
+def _do_execute(query, args, append):
+    """Demonstrate llmr.mcp.execute_tool()"""
+    append("=== MCP Execute Tool Demo ===\n")
+    append(f"Using llmr.mcp.execute_tool(\"{query}\", {args}) to run a tool:\n\n")
 
     if not query:
-        result.append("Error: Please provide a 'query' parameter with the tool name")
-    else:
-        try:
-            output = llmr.mcp.execute_tool(query, args)
-            result.append("Tool output:\n" + output)
-        except Exception as e:
-            result.append("Error executing tool: " + str(e))
+        append("Error: Please provide a 'query' parameter with the tool name")
+        return
+
+    append(_safe_call("Tool output:\n", "Error executing tool: ", llmr.mcp.execute_tool, query, args))
 
-elif action == "script":
-    # Demonstrate llmr.mcp.execute_script()
-    result.append("=== MCP Execute Script Demo ===\n")
-    result.append("Using llmr.mcp.execute_script() to run arbitrary code:\n\n")
+def _do_script(query, args, append):
+    """Demonstrate llmr.mcp.execute_code()"""
+    append("=== MCP Execute Script Demo ===\n")
+    append("Using llmr.mcp.execute_code() to run arbitrary code:\n\n")
 
     # Example: Run a simple calculation script
     code = """
 def fibonacci(n):
-    if n <= 1:
-        return n
-    return fibonacci(n-1) + fibonacci(n-2)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 print("Fibonacci sequence (first 10 numbers):")
 for i in range(10):
-    print("  fib(" + str(i) + ") = " + str(fibonacci(i)))
+    print(f"  fib({i}) = {fibonacci(i)}")
 """
 
-    result.append("Code:\n" + code + "\n")
-    result.append("Output:\n")
+    append(f"Code:\n{code}\n")
+    append("Output:\n")
 
-    try:
-        output = llmr.mcp.execute_script(code)
-        result.append(output)
-    except Exception as e:
-        result.append("Error: " + str(e))
+    append(_safe_call("", "Error: ", llmr.mcp.execute_code, code))
 
-elif action == "call":
-    # Demonstrate llmr.mcp.call_tool() - direct MCP tool call
-    result.append("=== MCP Call Tool Demo ===\n")
-    result.append("Using llmr.mcp.call_tool(\"" + query + "\", " + str(args) + ") to call an MCP tool directly:\n\n")
+def _do_call(query, args, append):
+    """Demonstrate llmr.mcp.call_tool() - direct MCP tool call"""
+    append("=== MCP Call Tool Demo ===\n")
+    append(f"Using llmr.mcp.call_tool(\"{query}\", {args}) to call an MCP tool directly:\n\n")
 
     if not query:
-        result.append("Error: Please provide a 'query' parameter with the tool name")
-    else:
-        try:
-            output = llmr.mcp.call_tool(query, args)
-            result.append("Tool output:\n" + output)
-        except Exception as e:
-            result.append("Error calling tool: " + str(e))
+        append("Error: Please provide a 'query' parameter with the tool name")
+        return
 
-elif action == "full_demo":
-    # Full demonstration of all functions
-    result.append("=== Full MCP Library Demo ===\n\n")
+    append(_safe_call("Tool output:\n", "Error calling tool: ", llmr.mcp.call_tool, query, args))
 
-    # 1. List tools
-    result.append("1. Listing all tools with llmr.mcp.list_tools():\n")
-    tools = llmr.mcp.list_tools()
-    count = 0
-    for tool in tools:
-        if count < 5:
-            result.append("   • " + tool['name'] + "\n")
-        count = count + 1
-    if len(tools) > 5:
-        result.append("   ... and " + str(len(tools) - 5) + " more\n")
+def _do_full_demo(query, args, append):
+    """Full demonstration of all functions"""
+    append("=== Full MCP Library Demo ===\n\n")
 
-    # 2. Search for calculator
-    result.append("\n2. Searching for 'calculator' with llmr.mcp.tool_search():\n")
-    matches = llmr.mcp.tool_search("calculator")
-    for tool in matches:
-        score = tool.get('score', 0)
-        result.append("   • " + tool['name'] + " (score: " + str(score) + ")\n")
+    # The four calls are independent, so start them together and wait for them all.
+    # Each step reports its own error so one unavailable function does not end the demo.
+    tools_call = threads.run(_attempt, llmr.mcp.list_tools)
+    matches_call = threads.run(_attempt, llmr.mcp.tool_search, "calculator")
+    calc_call = threads.run(_attempt, llmr.mcp.call_tool, "calculator", {"operation": "multiply", "a": 7, "b": 6})
+    script_call = threads.run(_attempt, llmr.mcp.execute_code, "print('Hello from execute_code!')")
 
-    # 3. Execute calculator
-    result.append("\n3. Executing calculator with llmr.mcp.execute_tool():\n")
-    calc_result = llmr.mcp.execute_tool("calculator", {"operation": "multiply", "a": 7, "b": 6})
-    result.append("   7 × 6 = " + calc_result + "\n")
+    tools, tools_error = tools_call.get()
+    matches, matches_error = matches_call.get()
+    calc_result, calc_error = calc_call.get()
+    script_result, script_error = script_call.get()
 
-    # 4. Execute script
-    result.append("\n4. Running code with llmr.mcp.execute_script():\n")
-    script_result = llmr.mcp.execute_script("print('Hello from execute_script!')")
-    result.append("   " + script_result)
+    # 1. List tools
+    append("1. Listing all tools with llmr.mcp.list_tools():\n")
+    if tools_error:
+        append(f"   Error: {tools_error}\n")
+    else:
+        count = 0
+        for tool in tools:
+            if count < 5:
+                append(f"   • {tool['name']}\n")
+            count = count + 1
+        if len(tools) > 5:
+            append(f"   ... and {len(tools) - 5} more\n")
 
-    result.append("\n\nDemo complete!")
+    # 2. Search for calculator
+    append("\n2. Searching for 'calculator' with llmr.mcp.tool_search():\n")
+    if matches_error:
+        append(f"   Error: {matches_error}\n")
+    else:
+        for tool in matches:
+            score = tool.get('score', 0)
+            append(f"   • {tool['name']} (score: {score})\n")
+
+    # 3. Call calculator
+    append("\n3. Calling calculator with llmr.mcp.call_tool():\n")
+    if calc_error:
+        append(f"   Error: {calc_error}\n")
+    else:
+        append(f"   7 × 6 = {calc_result}\n")
 
+    # 4. Execute script
+    append("\n4. Running code with llmr.mcp.execute_code():\n")
+    if script_error:
+        append(f"   Error: {script_error}")
+    else:
+        append(f"   {script_result}")
+
+    append("\n\nDemo complete!")
+
+def _do_unknown(action, append):
+    """List the available actions"""
+    append(f"Unknown action: {action}\n\n")
+    append("Available actions:\n")
+    append("  • list - List all available tools\n")
+    append("  • search - Search for tools (requires 'query')\n")
+    append("  • execute - Execute a tool (requires 'query' for name, optional 'args')\n")
+    append("  • script - Demo execute_code with fibonacci\n")
+    append("  • call - Call an MCP tool directly (requires 'query' for name)\n")
+    append("  • full_demo - Run a full demonstration of all functions")
+
+# Map each action to the handler that writes its output
+HANDLERS = {
+    "list": _do_list,
+    "search": _do_search,
+    "execute": _do_execute,
+    "script": _do_script,
+    "call": _do_call,
+    "full_demo": _do_full_demo,
+}
+
+# Handlers write their output through the list's bound append method
+result = []
+handler = HANDLERS.get(action)
+if handler is None:
+    _do_unknown(action, result.append)
 else:
-    result.append("Unknown action: " + action + "\n\n")
-    result.append("Available actions:\n")
-    result.append("  • list - List all available tools\n")
-    result.append("  • search - Search for tools (requires 'query')\n")
-    result.append("  • execute - Execute a tool (requires 'query' for name, optional 'args')\n")
-    result.append("  • script - Demo execute_script with fibonacci\n")
-    result.append("  • call - Call an MCP tool directly (requires 'query' for name)\n")
-    result.append("  • full_demo - Run a full demonstration of all functions")
+    handler(query, args, result.append)
 
 llmr.mcp.return_string("".join(result))
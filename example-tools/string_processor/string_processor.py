@@ -1,39 +1,82 @@
 # Import MCP library for proper result handling
 import llmr.mcp
+import json
 
 # Import our string utilities library - dynamically loaded from libraries_path
 import string_utils
 
+def _count_words(text):
+    return f"The text has {string_utils.count_words(text)} word(s)"
+
+def _is_palindrome(text):
+    if string_utils.is_palindrome(text):
+        return f"'{text}' is a palindrome!"
+    return f"'{text}' is not a palindrome."
+
+# Map each operation to the function that performs it
+OPERATIONS = {
+    "reverse": string_utils.reverse_string,
+    "uppercase": string_utils.to_uppercase,
+    "lowercase": string_utils.to_lowercase,
+    "capitalize": string_utils.capitalize_words,
+    "count_words": _count_words,
+    "remove_spaces": string_utils.remove_spaces,
+    "is_palindrome": _is_palindrome,
+}
+
+# Map each operation to the string_utils function that applies it to a list of strings
+BATCH_OPERATIONS = {
+    "reverse": string_utils.reverse_string_batch,
+    "uppercase": string_utils.to_uppercase_batch,
+    "lowercase": string_utils.to_lowercase_batch,
+    "capitalize": string_utils.capitalize_words_batch,
+    "count_words": string_utils.count_words_batch,
+    "remove_spaces": string_utils.remove_spaces_batch,
+    "is_palindrome": string_utils.is_palindrome_batch,
+}
+
+def _parse_texts(value):
+    """Return the list of strings encoded in value as JSON, or None if it is not one"""
+    try:
+        texts = json.loads(value)
+    except Exception:
+        return None
+    if not isinstance(texts, list):
+        return None
+    for text in texts:
+        if not isinstance(text, str):
+            return None
+    return texts
+
+def _unknown_operation(operation):
+    return f"Error: Unknown operation '{operation}'. Available operations: reverse, uppercase, lowercase, capitalize, count_words, remove_spaces, is_palindrome"
+
 def process_text(operation, text):
     """Process text using the string utilities library"""
-
-    if operation == "reverse":
-        return string_utils.reverse_string(text)
-    elif operation == "uppercase":
-        return string_utils.to_uppercase(text)
-    elif operation == "lowercase":
-        return string_utils.to_lowercase(text)
-    elif operation == "capitalize":
-        return string_utils.capitalize_words(text)
-    elif operation == "count_words":
-        count = string_utils.count_words(text)
-        return f"The text has {count} word(s)"
-    elif operation == "remove_spaces":
-        return string_utils.remove_spaces(text)
-    elif operation == "is_palindrome":
-        result = string_utils.is_palindrome(text)
-        if result:
-            return f"'{text}' is a palindrome!"
-        else:
-            return f"'{text}' is not a palindrome."
-    else:
-        return f"Error: Unknown operation '{operation}'. Available operations: reverse, uppercase, lowercase, capitalize, count_words, remove_spaces, is_palindrome"
+    op = OPERATIONS.get(operation)
+    if op is None:
+        return _unknown_operation(operation)
+    return op(text)
 
 # Get parameters using llmr.mcp.get()
 operation = llmr.mcp.get("operation")
 text = llmr.mcp.get("text")
+texts = llmr.mcp.get("texts")
 
-result = process_text(operation, text)
+if texts:
+    # Process every string in one call, returning a JSON list with one result per string
+    strings = _parse_texts(texts)
+    op = BATCH_OPERATIONS.get(operation)
+    if strings is None:
+        llmr.mcp.return_string("Error: 'texts' must be a JSON list of strings")
+    elif op is None:
+        llmr.mcp.return_string(_unknown_operation(operation))
+    else:
+        llmr.mcp.return_object(op(strings))
+elif text is None:
+    llmr.mcp.return_string("Error: Please provide a 'text' or 'texts' parameter")
+else:
+    result = process_text(operation, text)
 
-# Return the result using MCP library
-llmr.mcp.return_string(str(result))
\ No newline at end of file
+    # Return the result using MCP library
+    llmr.mcp.return_string(str(result))
@@ -0,0 +1,219 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"strings"
+	"testing"
+
+	"github.com/paularlott/mcp"
+)
+
+// runLibraryScript runs a script with example-libs available for import and returns its text result
+func runLibraryScript(t *testing.T, script string, args map[string]interface{}) string {
+	t.Helper()
+
+	mcpServer := &MCPServer{
+		logger:        &testLogger{},
+		router:        &Router{},
+		librariesPath: "example-libs",
+	}
+
+	return runServerScript(t, mcpServer, script, args)
+}
+
+// runServerScript runs a script on mcpServer and returns its text result
+func runServerScript(t *testing.T, mcpServer *MCPServer, script string, args map[string]interface{}) string {
+	t.Helper()
+
+	response, err := mcpServer.executeScriptTool(script, mcp.NewToolRequest(args))
+	if err != nil {
+		t.Fatalf("executeScriptTool failed: %v", err)
+	}
+
+	data, err := json.Marshal(response)
+	if err != nil {
+		t.Fatalf("Failed to marshal response: %v", err)
+	}
+
+	var decoded struct {
+		Content []struct {
+			Text string `json:"text"`
+		} `json:"content"`
+	}
+	if err := json.Unmarshal(data, &decoded); err != nil {
+		t.Fatalf("Failed to decode response: %v", err)
+	}
+	if len(decoded.Content) == 0 {
+		t.Fatal("Expected response content")
+	}
+	return decoded.Content[0].Text
+}
+
+// TestStringUtilsCountWords tests count_words against strings using separators other than single spaces
+func TestStringUtilsCountWords(t *testing.T) {
+	cases := []struct {
+		text     string
+		expected int
+	}{
+		{"", 0},
+		{"   ", 0},
+		{"hello", 1},
+		{"hello world", 2},
+		{"  hello  world  ", 2},
+		{"a\tb\nc\r\nd", 4},
+		{"a\vb", 2},
+		{"a\fb", 2},
+		{"a \v b", 2},
+		{"a\u0085b", 2},
+		{"a\u00a0b", 2},
+		{"a\u3000b", 2},
+	}
+
+	texts := make([]interface{}, len(cases))
+	for i, c := range cases {
+		texts[i] = c.text
+	}
+
+	text := runLibraryScript(t, `
+import llmr.mcp
+import string_utils
+
+llmr.mcp.return_object([string_utils.count_words(text) for text in texts])
+`, map[string]interface{}{"texts": texts})
+
+	var counts []int
+	if err := json.Unmarshal([]byte(text), &counts); err != nil {
+		t.Fatalf("Expected a JSON list of counts, got '%s'", text)
+	}
+	if len(counts) != len(cases) {
+		t.Fatalf("Expected %d counts, got %d", len(cases), len(counts))
+	}
+	for i, c := range cases {
+		if counts[i] != c.expected {
+			t.Errorf("count_words(%q) expected %d, got %d", c.text, c.expected, counts[i])
+		}
+	}
+}
+
+// TestStringProcessorTexts tests that the string_processor tool applies an operation to a JSON list of texts
+func TestStringProcessorTexts(t *testing.T) {
+	script, err := os.ReadFile("example-tools/string_processor/string_processor.py")
+	if err != nil {
+		t.Fatalf("Failed to read script: %v", err)
+	}
+
+	tests := []struct {
+		operation string
+		texts     string
+		expected  string
+	}{
+		{"uppercase", `["hello", "World"]`, `["HELLO","WORLD"]`},
+		{"capitalize", `["hello world", "don't stop"]`, `["Hello World","Don't Stop"]`},
+		{"count_words", `["one two", "", "  three  "]`, `[2,0,1]`},
+		{"is_palindrome", `["Never odd or even", "abc"]`, `[true,false]`},
+		{"reverse", `[1, 2]`, "Error: 'texts' must be a JSON list of strings"},
+		{"reverse", `not json`, "Error: 'texts' must be a JSON list of strings"},
+	}
+
+	for _, tt := range tests {
+		result := runLibraryScript(t, string(script), map[string]interface{}{
+			"operation": tt.operation,
+			"texts":     tt.texts,
+		})
+		if result != tt.expected {
+			t.Errorf("%s %s expected '%s', got '%s'", tt.operation, tt.texts, tt.expected, result)
+		}
+	}
+
+	result := runLibraryScript(t, string(script), map[string]interface{}{"operation": "reverse"})
+	if result != "Error: Please provide a 'text' or 'texts' parameter" {
+		t.Errorf("Expected an error without text or texts, got '%s'", result)
+	}
+}
+
+// TestAITestToolValidation tests that ai_test rejects missing and malformed questions before calling a model
+func TestAITestToolValidation(t *testing.T) {
+	script, err := os.ReadFile("example-tools/ai_test_tool/ai_test.py")
+	if err != nil {
+		t.Fatalf("Failed to read script: %v", err)
+	}
+
+	tests := []struct {
+		args     map[string]interface{}
+		expected string
+	}{
+		{map[string]interface{}{}, "Error: Please provide a 'question' or 'questions' parameter"},
+		{map[string]interface{}{"questions": `[]`}, "Error: 'questions' must be a non-empty JSON list of strings"},
+		{map[string]interface{}{"questions": `["a", 1]`}, "Error: 'questions' must be a non-empty JSON list of strings"},
+		{map[string]interface{}{"questions": `not json`}, "Error: 'questions' must be a non-empty JSON list of strings"},
+	}
+
+	for _, tt := range tests {
+		result := runLibraryScript(t, string(script), tt.args)
+		if result != tt.expected {
+			t.Errorf("Args %v expected '%s', got '%s'", tt.args, tt.expected, result)
+		}
+	}
+}
+
+// TestMCPDemoTool tests the mcp_demo tool against a server loaded with the example tools
+func TestMCPDemoTool(t *testing.T) {
+	script, err := os.ReadFile("example-tools/mcp_demo/mcp_demo.py")
+	if err != nil {
+		t.Fatalf("Failed to read script: %v", err)
+	}
+
+	config := &Config{
+		Scriptling: ScriptlingConfig{
+			ToolsPath:     "example-tools",
+			LibrariesPath: "example-libs",
+		},
+	}
+	mcpServer, err := NewMCPServer(config, &testLogger{}, &Router{})
+	if err != nil {
+		t.Fatalf("Failed to create MCP server: %v", err)
+	}
+
+	tests := []struct {
+		args     map[string]interface{}
+		expected []string
+	}{
+		{
+			map[string]interface{}{"action": "full_demo"},
+			[]string{
+				"=== Full MCP Library Demo ===",
+				"1. Listing all tools with llmr.mcp.list_tools():\n   • ",
+				"7 × 6 = 42",
+				"Hello from execute_code!",
+				"Demo complete!",
+			},
+		},
+		{
+			map[string]interface{}{"action": "script"},
+			[]string{
+				"Fibonacci sequence (first 10 numbers):",
+				"fib(0) = 0",
+				"fib(1) = 1",
+				"fib(9) = 34",
+			},
+		},
+		{
+			map[string]interface{}{"action": "call"},
+			[]string{"Error: Please provide a 'query' parameter with the tool name"},
+		},
+		{
+			map[string]interface{}{"action": "bogus"},
+			[]string{"Unknown action: bogus", "Available actions:", "full_demo - Run a full demonstration"},
+		},
+	}
+
+	for _, tt := range tests {
+		result := runServerScript(t, mcpServer, string(script), tt.args)
+		for _, expected := range tt.expected {
+			if !strings.Contains(result, expected) {
+				t.Errorf("Action %v expected output to contain '%s', got:\n%s", tt.args["action"], expected, result)
+			}
+		}
+	}
+}
@@ -90,17 +90,7 @@ func (m *MCPLibrary) GetLibrary() *object.Library {
 				return []map[string]string{}
 			}
 
-			tools := m.mcpServer.server.ListTools()
-			result := make([]map[string]string, len(tools))
-
-			for i, tool := range tools {
-				result[i] = map[string]string{
-					"name":        tool.Name,
-					"description": tool.Description,
-				}
-			}
-
-			return result
+			return m.mcpServer.listTools()
 		}, "list_tools() - List all available MCP tools").
 		FunctionWithHelp("call_tool", func(toolName string, toolArgs map[string]interface{}) (interface{}, error) {
 			if m.mcpServer == nil || m.mcpServer.server == nil {
@@ -108,7 +98,7 @@ func (m *MCPLibrary) GetLibrary() *object.Library {
 			}
 
 			// Call the tool directly via MCP server
-			resp, err := m.mcpServer.server.CallTool(context.Background(), toolName, toolArgs)
+			resp, err := m.mcpServer.server.CallTool(m.mcpServer.withToolProviders(context.Background()), toolName, toolArgs)
 			if err != nil {
 				return nil, fmt.Errorf("tool call failed: %v", err)
 			}
@@ -127,7 +117,7 @@ func (m *MCPLibrary) GetLibrary() *object.Library {
 				"query": query,
 			}
 
-			resp, err := m.mcpServer.server.CallTool(context.Background(), "tool_search", searchArgs)
+			resp, err := m.mcpServer.server.CallTool(m.mcpServer.withToolProviders(context.Background()), "tool_search", searchArgs)
 			if err != nil {
 				return nil, fmt.Errorf("tool search failed: %v", err)
 			}
@@ -146,7 +136,7 @@ func (m *MCPLibrary) GetLibrary() *object.Library {
 				"arguments": arguments,
 			}
 
-			resp, err := m.mcpServer.server.CallTool(context.Background(), "execute_tool", executeArgs)
+			resp, err := m.mcpServer.server.CallTool(m.mcpServer.withToolProviders(context.Background()), "execute_tool", executeArgs)
 			if err != nil {
 				return nil, fmt.Errorf("tool execution failed: %v", err)
 			}
@@ -160,7 +150,7 @@ func (m *MCPLibrary) GetLibrary() *object.Library {
 			}
 
 			// Use the execute_code MCP tool
-			resp, err := m.mcpServer.server.CallTool(context.Background(), "execute_code", map[string]interface{}{
+			resp, err := m.mcpServer.server.CallTool(m.mcpServer.withToolProviders(context.Background()), "execute_code", map[string]interface{}{
 				"code": code,
 			})
 			if err != nil {
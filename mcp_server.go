@@ -7,6 +7,8 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
+	"time"
 
 	"github.com/BurntSushi/toml"
 	"github.com/paularlott/llmrouter/log"
@@ -34,6 +36,7 @@ type toolConfig struct {
 	Script      string                   `toml:"script"`
 	Visibility  string                   `toml:"visibility"` // "native" (default) or "ondemand"
 	Parameters  map[string]toolParameter `toml:"parameters"`
+	scriptPath  string                   // resolved path to the script, set by scanTools
 }
 
 // toolParameter defines a tool parameter from tool.toml
@@ -109,6 +112,7 @@ func (p *ScriptToolProvider) scanTools() (map[string]*toolConfig, error) {
 			return nil
 		}
 
+		cfg.scriptPath = scriptPath
 		tools[cfg.Name] = &cfg
 		return nil
 	})
@@ -172,37 +176,7 @@ func (p *ScriptToolProvider) ExecuteTool(ctx context.Context, name string, param
 		return nil, mcp.ErrUnknownTool // Not handled by this provider
 	}
 
-	// Find script path
-	var scriptPath string
-	filepath.Walk(p.mcpServer.toolsPath, func(path string, info os.FileInfo, err error) error {
-		if err != nil || info.IsDir() || !strings.HasSuffix(info.Name(), "tool.toml") {
-			return nil
-		}
-
-		toolDir := filepath.Dir(path)
-		toolName := filepath.Base(toolDir)
-
-		var testCfg struct {
-			Name string `toml:"name"`
-		}
-		if _, err := toml.DecodeFile(path, &testCfg); err != nil {
-			return nil
-		}
-		if testCfg.Name == "" {
-			testCfg.Name = toolName
-		}
-		if testCfg.Name == name {
-			scriptPath = filepath.Join(toolDir, cfg.Script)
-			return filepath.SkipAll
-		}
-		return nil
-	})
-
-	if scriptPath == "" {
-		return nil, mcp.ErrUnknownTool
-	}
-
-	response, err := p.mcpServer.executeScriptToolFromPath(scriptPath, mcp.NewToolRequest(params))
+	response, err := p.mcpServer.executeScriptToolFromPath(cfg.scriptPath, mcp.NewToolRequest(params))
 	if err != nil {
 		return nil, err
 	}
@@ -211,15 +185,21 @@ func (p *ScriptToolProvider) ExecuteTool(ctx context.Context, name string, param
 
 var _ mcp.ToolProvider = (*ScriptToolProvider)(nil)
 
+// toolListCacheTTL is how long the tool list returned to scripts is reused
+const toolListCacheTTL = 30 * time.Second
+
 // MCPServer wraps the MCP server functionality
 type MCPServer struct {
-	server        *mcp.Server
-	scriptling    *scriptling.Scriptling
-	config        *Config
-	logger        Logger
-	router        *Router
-	toolsPath     string
-	librariesPath string
+	server          *mcp.Server
+	scriptling      *scriptling.Scriptling
+	config          *Config
+	logger          Logger
+	router          *Router
+	toolsPath       string
+	librariesPath   string
+	toolListMu      sync.Mutex
+	toolList        []map[string]string // cached result of listTools
+	toolListExpires time.Time
 }
 
 // buildParameters converts tool parameters to mcp.Parameter slice
@@ -452,23 +432,52 @@ func (m *MCPServer) executeScriptTool(scriptContent string, req *mcp.ToolRequest
 	return mcp.NewToolResponseText(response.String()), nil
 }
 
+// listTools returns the name and description of each registered tool, reusing the result for toolListCacheTTL
+func (m *MCPServer) listTools() []map[string]string {
+	m.toolListMu.Lock()
+	defer m.toolListMu.Unlock()
+
+	now := time.Now()
+	if m.toolList != nil && now.Before(m.toolListExpires) {
+		return m.toolList
+	}
+
+	tools := m.server.ListTools()
+	result := make([]map[string]string, len(tools))
+	for i, tool := range tools {
+		result[i] = map[string]string{
+			"name":        tool.Name,
+			"description": tool.Description,
+		}
+	}
+
+	m.toolList = result
+	m.toolListExpires = now.Add(toolListCacheTTL)
+	return result
+}
+
 // HandleRequest handles HTTP requests to the MCP server.
 // The tool mode is determined from the X-MCP-Tool-Mode header or tool_mode query parameter.
 // With session management enabled, the mode is stored in the session during initialize.
 // Native-visibility tools from providers appear in tools/list in normal mode.
 // In discovery mode (X-MCP-Tool-Mode: discovery), only tool_search and execute_tool are visible.
 func (m *MCPServer) HandleRequest(w http.ResponseWriter, r *http.Request) {
+	// Start with providers attached - the MCP server handles mode from headers/session
+	m.server.HandleRequest(w, r.WithContext(m.withToolProviders(r.Context())))
+}
+
+// withToolProviders returns ctx with the script tool providers attached, so tool calls made with it can reach script tools
+func (m *MCPServer) withToolProviders(ctx context.Context) context.Context {
 	nativeProvider := NewNativeScriptToolProvider(m)
 	onDemandProvider := NewOnDemandScriptToolProvider(m)
 
-	// Start with providers attached - the MCP server handles mode from headers/session
-	ctx := mcp.WithToolProviders(r.Context(), nativeProvider)
+	ctx = mcp.WithToolProviders(ctx, nativeProvider)
 
 	// Add ondemand provider if there are any ondemand tools
-	onDemandTools, _ := onDemandProvider.GetTools(r.Context())
+	onDemandTools, _ := onDemandProvider.GetTools(ctx)
 	if len(onDemandTools) > 0 {
 		ctx = mcp.WithOnDemandToolProviders(ctx, onDemandProvider)
 	}
 
-	m.server.HandleRequest(w, r.WithContext(ctx))
+	return ctx
 }
@@ -5,6 +5,9 @@ import (
 	"os"
 	"path/filepath"
 	"testing"
+	"time"
+
+	"github.com/paularlott/mcp"
 )
 
 // testLogger implements Logger for testing
@@ -226,3 +229,79 @@ required = false
 		t.Error("Expected input schema to be present")
 	}
 }
+
+// TestListToolsCache tests that the tool list is reused until it expires
+func TestListToolsCache(t *testing.T) {
+	config := &Config{}
+	mcpServer, err := NewMCPServer(config, &testLogger{}, &Router{})
+	if err != nil {
+		t.Fatalf("Failed to create MCP server: %v", err)
+	}
+
+	hasTool := func(tools []map[string]string, name string) bool {
+		for _, tool := range tools {
+			if tool["name"] == name {
+				return true
+			}
+		}
+		return false
+	}
+
+	if !hasTool(mcpServer.listTools(), "execute_code") {
+		t.Fatal("Expected execute_code in tool list")
+	}
+
+	mcpServer.server.RegisterTool(
+		mcp.NewTool("late_tool", "Registered after the list was cached"),
+		func(ctx context.Context, req *mcp.ToolRequest) (*mcp.ToolResponse, error) {
+			return mcp.NewToolResponseText("ok"), nil
+		},
+	)
+
+	if hasTool(mcpServer.listTools(), "late_tool") {
+		t.Error("Expected cached tool list to be returned before expiry")
+	}
+
+	// Force the cached list to expire
+	mcpServer.toolListExpires = time.Time{}
+
+	if !hasTool(mcpServer.listTools(), "late_tool") {
+		t.Error("Expected refreshed tool list to include late_tool")
+	}
+}
+
+// TestScanToolsResolvesScriptPath tests that scanned tools carry the path of their script
+func TestScanToolsResolvesScriptPath(t *testing.T) {
+	tempDir := t.TempDir()
+
+	toolDir := filepath.Join(tempDir, "nested", "path_tool")
+	os.MkdirAll(toolDir, 0755)
+	toolTOML := []byte(`
+name = "path_test"
+description = "Tool in a nested directory"
+script = "main.py"
+`)
+	os.WriteFile(filepath.Join(toolDir, "tool.toml"), toolTOML, 0644)
+	os.WriteFile(filepath.Join(toolDir, "main.py"), []byte("import llmr.mcp\nllmr.mcp.return_string('ok')\n"), 0644)
+
+	mcpServer := &MCPServer{
+		config:    &Config{},
+		logger:    &testLogger{},
+		toolsPath: tempDir,
+	}
+
+	tools, err := NewScriptToolProvider(mcpServer).scanTools()
+	if err != nil {
+		t.Fatalf("scanTools failed: %v", err)
+	}
+
+	cfg, exists := tools["path_test"]
+	if !exists {
+		t.Fatal("Expected path_test tool to be found")
+	}
+
+	expected := filepath.Join(toolDir, "main.py")
+	if cfg.scriptPath != expected {
+		t.Errorf("Expected script path '%s', got '%s'", expected, cfg.scriptPath)
+	}
+}
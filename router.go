@@ -19,11 +19,13 @@ import (
 
 func NewRouter(config *Config, logger Logger) (*Router, error) {
 	router := &Router{
-		Providers:    make(map[string]*Provider),
-		ModelMap:     make(map[string][]string),
-		config:       config,
-		logger:       logger,
-		shutdownChan: make(chan struct{}),
+		Providers:       make(map[string]*Provider),
+		ModelMap:        make(map[string][]string),
+		config:          config,
+		logger:          logger,
+		shutdownChan:    make(chan struct{}),
+		completionCache: newCompletionCache(defaultCompletionCacheSize, defaultCompletionCacheTTL),
+		semanticCache:   newSemanticCache(defaultSemanticCacheSize, defaultSemanticCacheTTL),
 	}
 
 	// Initialize providers
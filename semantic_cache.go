@@ -0,0 +1,133 @@
+package main
+
+import (
+	"math"
+	"sync"
+	"time"
+)
+
+const (
+	defaultSemanticCacheSize      = 1024
+	defaultSemanticCacheTTL       = 10 * time.Minute
+	defaultSemanticCacheThreshold = 0.92
+)
+
+// semanticCache is an in-memory cache of completion results looked up by embedding similarity,
+// allowing paraphrased questions to reuse an earlier answer
+type semanticCache struct {
+	mu       sync.RWMutex
+	maxItems int
+	ttl      time.Duration
+	entries  []*semanticCacheEntry // oldest first
+}
+
+// semanticCacheEntry is a single cached completion and the embedding of its question
+type semanticCacheEntry struct {
+	partition string    // only entries in the same partition are compared
+	embedding []float64 // normalized to unit length
+	value     string
+	expires   time.Time
+}
+
+// newSemanticCache creates a cache holding at most maxItems entries for ttl each
+func newSemanticCache(maxItems int, ttl time.Duration) *semanticCache {
+	return &semanticCache{
+		maxItems: maxItems,
+		ttl:      ttl,
+	}
+}
+
+// Lookup returns the value of the most similar entry in the partition if its
+// cosine similarity to embedding is at least threshold
+func (c *semanticCache) Lookup(partition string, embedding []float64, threshold float64) (string, bool) {
+	query := normalizeVector(embedding)
+	if query == nil {
+		return "", false
+	}
+
+	c.mu.RLock()
+	defer c.mu.RUnlock()
+
+	now := time.Now()
+	var best *semanticCacheEntry
+	bestScore := threshold
+	for _, entry := range c.entries {
+		if entry.partition != partition || len(entry.embedding) != len(query) || now.After(entry.expires) {
+			continue
+		}
+
+		// Both vectors are unit length so the dot product is the cosine similarity
+		var score float64
+		for i, v := range query {
+			score += v * entry.embedding[i]
+		}
+
+		if score >= bestScore {
+			best = entry
+			bestScore = score
+		}
+	}
+
+	if best == nil {
+		return "", false
+	}
+	return best.value, true
+}
+
+// Add stores value against embedding, dropping expired entries and the oldest entries when full
+func (c *semanticCache) Add(partition string, embedding []float64, value string) {
+	normalized := normalizeVector(embedding)
+	if normalized == nil {
+		return
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	now := time.Now()
+	live := c.entries[:0]
+	for _, entry := range c.entries {
+		if now.Before(entry.expires) {
+			live = append(live, entry)
+		}
+	}
+	for i := len(live); i < len(c.entries); i++ {
+		c.entries[i] = nil
+	}
+
+	c.entries = append(live, &semanticCacheEntry{
+		partition: partition,
+		embedding: normalized,
+		value:     value,
+		expires:   now.Add(c.ttl),
+	})
+
+	if c.maxItems > 0 && len(c.entries) > c.maxItems {
+		c.entries = append([]*semanticCacheEntry(nil), c.entries[len(c.entries)-c.maxItems:]...)
+	}
+}
+
+// Len returns the number of entries in the cache, including expired ones not yet removed
+func (c *semanticCache) Len() int {
+	c.mu.RLock()
+	defer c.mu.RUnlock()
+	return len(c.entries)
+}
+
+// normalizeVector returns a unit length copy of v, or nil if v has no magnitude
+func normalizeVector(v []float64) []float64 {
+	var sum float64
+	for _, x := range v {
+		sum += x * x
+	}
+	if sum == 0 {
+		return nil
+	}
+
+	norm := math.Sqrt(sum)
+	result := make([]float64, len(v))
+	for i, x := range v {
+		result[i] = x / norm
+	}
+	return result
+}
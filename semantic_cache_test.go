@@ -0,0 +1,84 @@
+package main
+
+import (
+	"testing"
+	"time"
+)
+
+// TestSemanticCacheLookup tests that similar embeddings match and dissimilar ones do not
+func TestSemanticCacheLookup(t *testing.T) {
+	cache := newSemanticCache(10, time.Minute)
+
+	cache.Add("p1", []float64{1, 0, 0}, "first")
+	cache.Add("p1", []float64{0, 1, 0}, "second")
+
+	// Scaled vectors have the same direction so should match exactly
+	value, ok := cache.Lookup("p1", []float64{2, 0, 0}, 0.92)
+	if !ok {
+		t.Fatal("Expected hit for a vector in the same direction")
+	}
+	if value != "first" {
+		t.Errorf("Expected 'first', got '%s'", value)
+	}
+
+	// Closest entry wins
+	value, ok = cache.Lookup("p1", []float64{0.1, 1, 0}, 0.92)
+	if !ok {
+		t.Fatal("Expected hit for a nearby vector")
+	}
+	if value != "second" {
+		t.Errorf("Expected 'second', got '%s'", value)
+	}
+
+	if _, ok := cache.Lookup("p1", []float64{1, 1, 0}, 0.92); ok {
+		t.Error("Expected miss for a vector below the threshold")
+	}
+
+	if _, ok := cache.Lookup("p2", []float64{1, 0, 0}, 0.92); ok {
+		t.Error("Expected miss for a different partition")
+	}
+
+	if _, ok := cache.Lookup("p1", []float64{1, 0}, 0.92); ok {
+		t.Error("Expected miss for a vector of different dimensions")
+	}
+
+	if _, ok := cache.Lookup("p1", []float64{0, 0, 0}, 0.92); ok {
+		t.Error("Expected miss for a zero vector")
+	}
+}
+
+// TestSemanticCacheExpiry tests that expired entries are ignored and removed
+func TestSemanticCacheExpiry(t *testing.T) {
+	cache := newSemanticCache(10, 10*time.Millisecond)
+
+	cache.Add("p1", []float64{1, 0}, "old")
+	time.Sleep(20 * time.Millisecond)
+
+	if _, ok := cache.Lookup("p1", []float64{1, 0}, 0.92); ok {
+		t.Error("Expected expired entry to be a miss")
+	}
+
+	cache.Add("p1", []float64{0, 1}, "new")
+	if cache.Len() != 1 {
+		t.Errorf("Expected expired entry to be removed, got %d entries", cache.Len())
+	}
+}
+
+// TestSemanticCacheEviction tests that the oldest entries are dropped when full
+func TestSemanticCacheEviction(t *testing.T) {
+	cache := newSemanticCache(2, time.Minute)
+
+	cache.Add("p1", []float64{1, 0, 0}, "a")
+	cache.Add("p1", []float64{0, 1, 0}, "b")
+	cache.Add("p1", []float64{0, 0, 1}, "c")
+
+	if cache.Len() != 2 {
+		t.Errorf("Expected 2 entries, got %d", cache.Len())
+	}
+	if _, ok := cache.Lookup("p1", []float64{1, 0, 0}, 0.92); ok {
+		t.Error("Expected oldest entry to be evicted")
+	}
+	if _, ok := cache.Lookup("p1", []float64{0, 0, 1}, 0.92); !ok {
+		t.Error("Expected newest entry to be kept")
+	}
+}
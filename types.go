@@ -48,6 +48,8 @@ type Router struct {
 	mux                  *http.ServeMux
 	responsesService     *responses.Service      // responses service instance
 	conversationsService *conversations.Service  // conversations service instance
+	completionCache      *completionCache        // cache for llmr.ai cached completions
+	semanticCache        *semanticCache          // cache for llmr.ai semantic completions
 }
 
 // OpenAI client interface